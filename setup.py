@@ -11,9 +11,8 @@ setup(
     classifiers=['Programming Language :: Python :: 3 :: Only'],
     py_modules=['tap_twinfield'],
     install_requires=[
-        'defusedxml~=0.6.0',
         'lxml~=4.6.2',
-        'pandas~=1.2.2',
+        'orjson~=3.5',
         'python-dateutil~=2.8.1',
         'singer-python~=5.10.0',
         'zeep~=4.0.0',
@@ -25,6 +24,7 @@ setup(
     packages=find_packages(),
     package_data={
         'tap_twinfield': [
+            'browse_queries/*.xml',
             'schemas/*.json',
         ],
     },
@@ -1,17 +1,143 @@
 """Cleaner functions."""
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from types import MappingProxyType
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 import hashlib
+import os
+import sys
 
-from tap_twinfield.streams import STREAMS
+import orjson
+
+# When set, row ids are derived from the period and row number instead
+# of a hash over the row. Only safe when the target is append-only and
+# existing ids do not have to stay stable.
+APPEND_ONLY: bool = bool(os.environ.get('TAP_TWINFIELD_APPEND_ONLY'))
+
+
+@lru_cache(maxsize=None)
+def _stream_plans() -> MappingProxyType:
+    """Retrieve the precompiled cleaning plans.
+
+    The plans are compiled next to the stream metadata in streams.py as
+    struct-of-arrays tuples. The import is deferred until the first
+    cleaner fires, so tap invocations that never clean a row do not pay
+    for it.
+
+    Returns:
+        MappingProxyType -- Precompiled cleaning plans
+    """
+    from tap_twinfield.streams import PLANS  # noqa: WPS433
+
+    return PLANS
+
+
+# Output fields copied verbatim from the raw report rows. The names
+# are interned so every reshaped row shares the same key objects.
+_GENERAL_LEDGER_DETAILS_KEYS: tuple = tuple(sys.intern(key) for key in (
+    'Administratie',
+    'Adm.naam',
+    'Jaar',
+    'Periode',
+    'Dagboek',
+    'Boekingsnummer',
+    'Status',
+    'Boekdatum',
+    'Valuta',
+    'Relatie',
+    'Relatienaam',
+    'Invoerdatum',
+    'Gebruikersnaam',
+    'Grootboekrek.',
+    'Grootboekrek.naam',
+    'Dimensietype 1',
+    'Kpl./rel.',
+    'Kpl.-/rel.naam',
+    'Dimensietype 2',
+    'Act./proj.',
+    'Act.-/proj.naam',
+    'Dimensietype 3',
+    'Bedrag',
+    'Basisbedrag',
+    'Rapportagebedrag',
+    'D/C',
+    'Btw-code',
+    'Btw-bedrag',
+    'Aantal',
+    'Cheque',
+    'Omschrijving',
+    'Factuurnummer',
+    'Vrij tekstveld 1',
+    'Vrij tekstveld 2',
+    'Vrij tekstveld 3',
+    'Boekingsoorsprong',
+    'transactie type groep',
+))
+_ANNUAL_REPORT_KEYS: tuple = tuple(sys.intern(key) for key in (
+    'Administratie',
+    'Adm.naam',
+    'Jaar',
+    'Periode',
+    'Grootboekrek.',
+    'Grootboekrek.naam',
+    'Dimensietype 1',
+    'Kpl./rel.',
+    'Kpl.-/rel.naam',
+    'Act./proj.',
+    'Act.-/proj.naam',
+    'Dimensietype 3',
+    'Basisbedrag',
+    'Rapportagebedrag',
+    'D/C',
+    'Aantal',
+))
+_ANNUAL_REPORT_MULTICURRENCY_KEYS: tuple = tuple(sys.intern(key) for key in (
+    'Administratie',
+    'Adm.naam',
+    'Jaar',
+    'Periode',
+    'Type',
+    'Grootboekrek.',
+    'Grootboekrek.naam',
+    'Valuta',
+    'Bedrag',
+    'Basisbedrag',
+    'Rapportagebedrag',
+    'D/C',
+    'Status',
+))
+
+# Dimension group column pairs, precomputed to avoid per-row formatting
+_GROUP_KEYS: tuple = tuple(
+    (sys.intern(f'Groep {index}'), sys.intern(f'Groepnaam {index}'))
+    for index in range(1, 6)
+)
 
 
 class ConvertionError(ValueError):
     """Failed to convert value."""
 
 
+def _hash_row(row: dict) -> str:
+    """Create a primary key for a row by hashing its values.
+
+    The row is serialized with orjson, which produces bytes directly at
+    C speed, so no intermediate Python string is built. Keys are sorted
+    to keep the digest independent of dict insertion order.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Returns:
+        str -- Hex digest of the row
+    """
+    return hashlib.blake2b(
+        orjson.dumps(row, option=orjson.OPT_SORT_KEYS),
+        digest_size=20,
+    ).hexdigest()
+
+
 def to_type_or_null(
     input_value: Any,
     data_type: Optional[Any] = None,
@@ -55,461 +181,227 @@ def to_type_or_null(
     return input_value
 
 
-def clean_row(row: dict, mapping: dict) -> dict:
-    """Clean the row according to the mapping.
+def clean_row(row: dict, plan: tuple) -> dict:
+    """Clean the row according to a precompiled plan.
 
-    The mapping is a dictionary with optional keys:
-    - map: The name of the new key/column
-    - type: A data type or function to apply to the value of the key
-    - nullable: Whether to convert empty values, such as '', {} or [] to None
+    The plan is a struct of arrays: four parallel tuples holding the
+    source keys, target keys, converters and nullability flags, compiled
+    from the stream mapping in streams.py. Zipping the tuples avoids the
+    three dict lookups per field per row that the mapping dictionaries
+    would otherwise cost.
 
     Arguments:
         row {dict} -- Input row
-        mapping {dict} -- Input mapping
+        plan {tuple} -- Precompiled cleaning plan
 
     Returns:
         dict -- Cleaned row
     """
-    cleaned: dict = {}
-
-    key: str
-    key_mapping: dict
-
-    # For every key and value in the mapping
-    for key, key_mapping in mapping.items():
-
-        # Retrieve the new mapping or use the original
-        new_mapping: str = key_mapping.get('map') or key
-
-        # Convert the value
-        cleaned[new_mapping] = to_type_or_null(
-            row[key],
-            key_mapping.get('type'),
-            key_mapping.get('null', True),
+    sources, targets, data_types, nullables = plan
+
+    return {
+        target: to_type_or_null(row[source], data_type, nullable)
+        for source, target, data_type, nullable in zip(
+            sources,
+            targets,
+            data_types,
+            nullables,
         )
+    }
 
-    return cleaned
-
-
-def clean_bank_transactions(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean bank transactions.
-
-    Arguments:
-        row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
-
-    Returns:
-        dict -- Cleaned row
-    """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['bank_transactions'].get('mapping')
-    
-    # Create primary key
-    row_string = str(row)
-    row['id'] = hashlib.sha1(row_string.encode()).hexdigest()
-
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(row, mapping)
-
-    # Else return the original row
-    return row
 
+def clean_row_rename_only(row: dict, plan: tuple) -> dict:
+    """Clean the row when the plan only renames fields.
 
-def clean_general_ledger_details(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean transaction_details.
+    For a plan without type conversions and with every field nullable,
+    to_type_or_null degenerates to `value or None`. Inlining that saves
+    a function call per field.
 
     Arguments:
         row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
+        plan {tuple} -- Precompiled cleaning plan
 
     Returns:
         dict -- Cleaned row
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['general_ledger_details'].get('mapping')
-
-    # Create primary key
-    row_string = str(row)
-
-    response_row = {
-        'id': hashlib.sha1(row_string.encode()).hexdigest(),
-        'Administratie': row.get('Administratie'),
-        'Adm.naam': row.get('Adm.naam'),
-        'Jaar': row.get('Jaar'),
-        'Periode': row.get('Periode'),
-        'Dagboek': row.get('Dagboek'),
-        'Boekingsnummer': row.get('Boekingsnummer'),
-        'Status': row.get('Status'),
-        'Boekdatum': row.get('Boekdatum'),
-        'Valuta': row.get('Valuta'),
-        'Relatie': row.get('Relatie'),
-        'Relatienaam': row.get('Relatienaam'),
-        'Invoerdatum': row.get('Invoerdatum'),
-        'Gebruikersnaam': row.get('Gebruikersnaam'),
-        'Grootboekrek.': row.get('Grootboekrek.'),
-        'Grootboekrek.naam': row.get('Grootboekrek.naam'),
-        'Dimensietype 1': row.get('Dimensietype 1'),
-        'Kpl./rel.': row.get('Kpl./rel.'),
-        'Kpl.-/rel.naam': row.get('Kpl.-/rel.naam'),
-        'Dimensietype 2': row.get('Dimensietype 2'),
-        'Act./proj.': row.get('Act./proj.'),
-        'Act.-/proj.naam': row.get('Act.-/proj.naam'),
-        'Dimensietype 3': row.get('Dimensietype 3'),
-        'Bedrag': row.get('Bedrag'),
-        'Basisbedrag': row.get('Basisbedrag'),
-        'Rapportagebedrag': row.get('Rapportagebedrag'),
-        'D/C': row.get('D/C'),
-        'Btw-code': row.get('Btw-code'),
-        'Btw-bedrag': row.get('Btw-bedrag'),
-        'Aantal': row.get('Aantal'),
-        'Cheque': row.get('Cheque'),
-        'Omschrijving': row.get('Omschrijving'),
-        'Factuurnummer': row.get('Factuurnummer'),
-        'groups': [
-            {
-                'group': row.get('Groep 1'),
-                'group_name': row.get('Groepnaam 1'),
-            },
-            {
-                'group': row.get('Groep 2'),
-                'group_name': row.get('Groepnaam 2'),
-            },
-            {
-                'group': row.get('Groep 3'),
-                'group_name': row.get('Groepnaam 3'),
-            },
-            {
-                'group': row.get('Groep 4'),
-                'group_name': row.get('Groepnaam 4'),
-            },
-            {
-                'group': row.get('Groep 5'),
-                'group_name': row.get('Groepnaam 5'),
-            },
-        ],
-        'Vrij tekstveld 1': row.get('Vrij tekstveld 1'),
-        'Vrij tekstveld 2': row.get('Vrij tekstveld 2'),
-        'Vrij tekstveld 3': row.get('Vrij tekstveld 3'),
-        'Boekingsoorsprong': row.get('Boekingsoorsprong'),
-        'transactie type groep': row.get('transactie type groep'),
+    return {
+        target: row[source] or None
+        for source, target in zip(plan[0], plan[1])
     }
 
-    # # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(response_row, mapping)
-
-    # Else return the original row
-    return response_row
 
-
-def clean_general_ledger_transactions(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean general ledger transactions.
+def _remap_general_ledger_details(row: dict) -> dict:
+    """Reshape a raw general ledger details row.
 
     Arguments:
         row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
 
     Returns:
-        dict -- Cleaned row
+        dict -- Reshaped row
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['general_ledger_transactions'].get(
-        'mapping',
-    )
+    reshaped: dict = {key: row.get(key) for key in _GENERAL_LEDGER_DETAILS_KEYS}
 
-    # Create primary key
+    # Collect the five dimension group pairs
+    reshaped['groups'] = [
+        {'group': row.get(group), 'group_name': row.get(group_name)}
+        for group, group_name in _GROUP_KEYS
+    ]
 
-    row_string = str(row)
-    row['id'] = hashlib.sha1(row_string.encode()).hexdigest()
+    return reshaped
 
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(row, mapping)
 
-    # Else return the original row
-    return row
-
-
-def clean_transactions_to_be_matched(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean transactions to be matched.
+def _remap_annual_report(row: dict) -> dict:
+    """Reshape a raw annual report row.
 
     Arguments:
         row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
 
     Returns:
-        dict -- Cleaned row
+        dict -- Reshaped row
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['transactions_to_be_matched'].get(
-        'mapping',
-    )
-
-    # Create primary key
-
-    row_string = str(row)
-    row['id'] = hashlib.sha1(row_string.encode()).hexdigest()
+    reshaped: dict = {key: row.get(key) for key in _ANNUAL_REPORT_KEYS}
 
+    # Collect the five dimension group pairs
+    reshaped['groups'] = [
+        {'group': row.get(group), 'group_name': row.get(group_name)}
+        for group, group_name in _GROUP_KEYS
+    ]
 
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(row, mapping)
+    return reshaped
 
-    # Else return the original row
-    return row
 
-
-def clean_annual_report(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean annual report.
+def _remap_annual_report_multicurrency(row: dict) -> dict:
+    """Reshape a raw annual report multicurrency row.
 
     Arguments:
         row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
 
     Returns:
-        dict -- Cleaned row
+        dict -- Reshaped row
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['annual_report'].get(
-        'mapping',
-    )
-
-    # Create primary key
-    row_string = str(row)
-
-    response_row = {
-        'id': hashlib.sha1(row_string.encode()).hexdigest(),
-        'Administratie': row.get('Administratie'),
-        'Adm.naam': row.get('Adm.naam'),
-        'Jaar': row.get('Jaar'),
-        'Periode': row.get('Periode'),
-        'Grootboekrek.': row.get('Grootboekrek.'),
-        'Grootboekrek.naam': row.get('Grootboekrek.naam'),
-        'Dimensietype 1': row.get('Dimensietype 1'),
-        'Kpl./rel.': row.get('Kpl./rel.'),
-        'Kpl.-/rel.naam': row.get('Kpl.-/rel.naam'),
-        'Act./proj.': row.get('Act./proj.'),
-        'Act.-/proj.naam': row.get('Act.-/proj.naam'),
-        'Dimensietype 3': row.get('Dimensietype 3'),
-        'Basisbedrag': row.get('Basisbedrag'),
-        'Rapportagebedrag': row.get('Rapportagebedrag'),
-        'D/C': row.get('D/C'),
-        'Aantal': row.get('Aantal'),
-        'groups': [
-            {
-                'group': row.get('Groep 1'),
-                'group_name': row.get('Groepnaam 1'),
-            },
-            {
-                'group': row.get('Groep 2'),
-                'group_name': row.get('Groepnaam 2'),
-            },
-            {
-                'group': row.get('Groep 3'),
-                'group_name': row.get('Groepnaam 3'),
-            },
-            {
-                'group': row.get('Groep 4'),
-                'group_name': row.get('Groepnaam 4'),
-            },
-            {
-                'group': row.get('Groep 5'),
-                'group_name': row.get('Groepnaam 5'),
-            },
-        ],
+    reshaped: dict = {
+        key: row.get(key)
+        for key in _ANNUAL_REPORT_MULTICURRENCY_KEYS
     }
 
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(response_row, mapping)
-
-    # Else return the original row
-    return response_row
-
-
-def clean_annual_report_multicurrency(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean annual report multicurrency.
-
-    Arguments:
-        row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
-
-    Returns:
-        dict -- Cleaned row
-    """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['annual_report_multicurrency'].get(
-        'mapping',
-    )
-
-    # Create primary key
-    row_string = str(row)
-
-    response_row = {
-        'id': hashlib.sha1(row_string.encode()).hexdigest(),
-        'Administratie': row.get('Administratie'),
-        'Adm.naam': row.get('Adm.naam'),
-        'Jaar': row.get('Jaar'),
-        'Periode': row.get('Periode'),
-        'Type': row.get('Type'),
-        'Grootboekrek.': row.get('Grootboekrek.'),
-        'Grootboekrek.naam': row.get('Grootboekrek.naam'),
-        'Valuta': row.get('Valuta'),
-        'Bedrag': row.get('Bedrag'),
-        'Basisbedrag': row.get('Basisbedrag'),
-        'Rapportagebedrag': row.get('Rapportagebedrag'),
-        'D/C': row.get('D/C'),
-        'Status': row.get('Status'),
-        'groups': [
-            {
-                'group': row.get('Groep 1'),
-                'group_name': row.get('Groepnaam 1'),
-            },
-            {
-                'group': row.get('Groep 2'),
-                'group_name': row.get('Groepnaam 2'),
-            },
-            {
-                'group': row.get('Groep 3'),
-                'group_name': row.get('Groepnaam 3'),
-            },
-            {
-                'group': row.get('Groep 4'),
-                'group_name': row.get('Groepnaam 4'),
-            },
-            {
-                'group': row.get('Groep 5'),
-                'group_name': row.get('Groepnaam 5'),
-            },
-        ],
-    }
+    # Collect the five dimension group pairs
+    reshaped['groups'] = [
+        {'group': row.get(group), 'group_name': row.get(group_name)}
+        for group, group_name in _GROUP_KEYS
+    ]
 
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(response_row, mapping)
+    return reshaped
 
-    # Else return the original row
-    return response_row
 
+def _make_cleaner(
+    stream_name: str,
+    remap: Optional[Callable] = None,
+    period_key: str = 'Periode',
+) -> Callable:
+    """Create a cleaner function for a stream.
 
-def clean_suppliers(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean annual report multicurrency.
+    Every cleaner shares the same shape: create a primary key by hashing
+    the raw row, optionally reshape the row and apply the precompiled
+    cleaning plan. The generated closure binds the plan and the remap
+    function once, so the per-row work needs no module lookups. With
+    APPEND_ONLY set, hashing is skipped entirely and the id is built
+    from the period and row number.
 
     Arguments:
-        row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
-
-    Returns:
-        dict -- Cleaned row
-    """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['suppliers'].get(
-        'mapping',
-    )
-
-    # Create primary key
-    row_string = str(row)
-    row['id'] = hashlib.sha1(row_string.encode()).hexdigest()
-
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(row, mapping)
+        stream_name {str} -- Stream name
 
-    # Else return the original row
-    return row
-
-
-def clean_transaction_summary(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean transaction_summary.
-
-    Arguments:
-        row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
+    Keyword Arguments:
+        remap {Optional[Callable]} -- Row reshaping function (default: {None})
+        period_key {str} -- Column holding the period (default: {'Periode'})
 
     Returns:
-        dict -- Cleaned row
+        Callable -- Cleaner for the stream
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['transaction_summary'].get(
-        'mapping',
-    )
-
-    # Create primary key
-    row_string = str(row)
-    row['id'] = hashlib.sha1(row_string.encode()).hexdigest()
-
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(row, mapping)
-
-    # Else return the original row
-    return row
-
-
-def clean_transaction_list(
-    row: dict,
-    row_number: int,
-) -> dict:
-    """Clean transaction_list.
-
-    Arguments:
-        row {dict} -- Input row
-        row_number {int} -- Row number, used to construct primary key
+    plan: Optional[tuple] = None
+    apply_plan: Callable = clean_row
+    resolved: bool = False
+
+    def resolve_plan() -> None:
+        # Resolve the plan on first use and pick the specialized
+        # cleaner for plans that only rename fields
+        nonlocal plan, apply_plan, resolved
+        plan = _stream_plans().get(stream_name)
+
+        rename_only: bool = bool(plan) and all(
+            data_type is None and nullable
+            for data_type, nullable in zip(plan[2], plan[3])
+        )
 
-    Returns:
-        dict -- Cleaned row
-    """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['transaction_list'].get(
-        'mapping',
-    )
-
-    # Create primary key
-    row_string = str(row)
-    row['id'] = hashlib.sha1(row_string.encode()).hexdigest()
-
-    # If a mapping has been defined in STREAMS, apply it
-    if mapping:
-        return clean_row(row, mapping)
-
-    # Else return the original row
-    return row
-
-
-# Collect all cleaners
-CLEANERS: MappingProxyType = MappingProxyType({
-    'bank_transactions': clean_bank_transactions,
-    'general_ledger_details': clean_general_ledger_details,
-    'general_ledger_transactions': clean_general_ledger_transactions,
-    'transactions_to_be_matched': clean_transactions_to_be_matched,
-    'annual_report': clean_annual_report,
-    'annual_report_multicurrency': clean_annual_report_multicurrency,
-    'suppliers': clean_suppliers,
-    'transaction_summary': clean_transaction_summary,
-    'transaction_list': clean_transaction_list,
-})
+        if rename_only:
+            apply_plan = clean_row_rename_only
+
+        resolved = True
+
+    def composite_id(row: dict, row_number: int) -> str:
+        # Prefix the period with the year for streams that report the
+        # period number without it
+        year: Any = row.get('Jaar')
+        period: str = str(row.get(period_key, ''))
+
+        if year:
+            period = f'{year}/{period}'
+
+        return '{0}-{1}'.format(period.replace('/', '-'), row_number)
+
+    def cleaner(row: dict, row_number: int) -> dict:
+        if not resolved:
+            resolve_plan()
+
+        # Reshape the row when the stream needs it
+        if remap:
+            new_row: dict = remap(row)
+        else:
+            new_row = row
+
+        # Create primary key from the raw row, the fastest hash being
+        # no hash at all when the target is append-only
+        if APPEND_ONLY:
+            new_row['id'] = composite_id(row, row_number)
+        else:
+            new_row['id'] = _hash_row(row)
+
+        # If a plan has been compiled for the stream, apply it
+        if plan:
+            return apply_plan(new_row, plan)
+
+        # Else return the original row
+        return new_row
+
+    return cleaner
+
+
+# Collect all cleaners. Per-row callers should bind their cleaner once
+# (cleaner = CLEANERS[stream]) instead of indexing inside the row loop.
+_CLEANERS: dict = {
+    'bank_transactions': _make_cleaner('bank_transactions'),
+    'general_ledger_details': _make_cleaner(
+        'general_ledger_details',
+        remap=_remap_general_ledger_details,
+    ),
+    'general_ledger_transactions': _make_cleaner(
+        'general_ledger_transactions',
+    ),
+    'transactions_to_be_matched': _make_cleaner(
+        'transactions_to_be_matched',
+    ),
+    'annual_report': _make_cleaner(
+        'annual_report',
+        remap=_remap_annual_report,
+    ),
+    'annual_report_multicurrency': _make_cleaner(
+        'annual_report_multicurrency',
+        remap=_remap_annual_report_multicurrency,
+    ),
+    'suppliers': _make_cleaner('suppliers'),
+    'transaction_summary': _make_cleaner(
+        'transaction_summary',
+        period_key='Jaar/periode (JJJJ/PP)',
+    ),
+    'transaction_list': _make_cleaner('transaction_list'),
+}
+CLEANERS: MappingProxyType = MappingProxyType(_CLEANERS)
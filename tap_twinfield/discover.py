@@ -4,7 +4,7 @@ from singer import metadata
 from singer.catalog import Catalog, CatalogEntry
 
 from tap_twinfield.schema import load_schemas
-from tap_twinfield.streams import STREAMS
+from tap_twinfield.streams import STREAMS, StreamSpec
 
 
 def discover() -> Catalog:  # noqa: WPS210
@@ -19,19 +19,13 @@ def discover() -> Catalog:  # noqa: WPS210
     # Parse every schema
     for stream_id, schema in raw_schemas.items():
 
-        stream_meta: dict = STREAMS[stream_id]
+        stream_meta: StreamSpec = STREAMS[stream_id]
         # Create metadata
         mdata: list = metadata.get_standard_metadata(
             schema=schema.to_dict(),
-            key_properties=stream_meta.get('key_properties', None),
-            valid_replication_keys=stream_meta.get(
-                'replication_keys',
-                None,
-            ),
-            replication_method=stream_meta.get(
-                'replication_method',
-                None,
-            ),
+            key_properties=stream_meta.key_properties,
+            valid_replication_keys=stream_meta.replication_keys,
+            replication_method=stream_meta.replication_method,
         )
 
         # Create a catalog entry
@@ -40,16 +34,10 @@ def discover() -> Catalog:  # noqa: WPS210
                 tap_stream_id=stream_id,
                 stream=stream_id,
                 schema=schema,
-                key_properties=stream_meta.get('key_properties', None),
+                key_properties=stream_meta.key_properties,
                 metadata=mdata,
-                replication_key=stream_meta.get(
-                    'replication_key',
-                    None,
-                ),
-                replication_method=stream_meta.get(
-                    'replication_method',
-                    None,
-                ),
+                replication_key=stream_meta.replication_key,
+                replication_method=stream_meta.replication_method,
             ),
         )
     return Catalog(streams)
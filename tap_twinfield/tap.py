@@ -2,23 +2,19 @@
 # -*- coding: utf-8 -*-
 import logging
 from argparse import Namespace
+from importlib.metadata import version
 
-import pkg_resources
 from singer import get_logger, utils
 from singer.catalog import Catalog
 
-from tap_twinfield.discover import discover
-from tap_twinfield.sync import sync
-from tap_twinfield.twinfield import Twinfield
-
-VERSION: str = pkg_resources.get_distribution('tap-twinfield').version
+VERSION: str = version('tap-twinfield')
 LOGGER: logging.RootLogger = get_logger()
-REQUIRED_CONFIG_KEYS: tuple = (
+REQUIRED_CONFIG_KEYS: frozenset = frozenset({
     'username',
     'password',
     'organisation',
     'office',
-)
+})
 
 
 @utils.handle_top_exception(LOGGER)
@@ -29,8 +25,11 @@ def main() -> None:
 
     LOGGER.info(f'>>> Running tap-twinfield v{VERSION}')
 
+    # Discovery and sync are imported on the path that needs them, so
+    # e.g. discovery mode never pays for the SOAP client import
     # If discover flag was passed, run discovery mode and dump output to stdout
     if args.discover:
+        from tap_twinfield.discover import discover  # noqa: WPS433
         catalog: Catalog = discover()
         catalog.dump()
         return
@@ -41,8 +40,12 @@ def main() -> None:
         catalog = args.catalog
     else:
         # Loadt the  catalog
+        from tap_twinfield.discover import discover  # noqa: WPS433
         catalog = discover()
 
+    from tap_twinfield.sync import sync  # noqa: WPS433
+    from tap_twinfield.twinfield import Twinfield  # noqa: WPS433
+
     # Initialize Twinfield client
     twinfield: Twinfield = Twinfield(
         args.config['username'],
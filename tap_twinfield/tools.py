@@ -1,6 +1,7 @@
 """Tools."""
 # -*- coding: utf-8 -*-
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Optional
 
 import singer
 from singer.catalog import CatalogEntry
@@ -8,6 +9,44 @@ from singer.catalog import CatalogEntry
 from tap_twinfield.streams import STREAMS
 
 
+def _yearperiod_bookmark(row: dict) -> str:
+    """Build a YYYY-MM bookmark from a yearperiod field.
+
+    Arguments:
+        row {dict} -- Record
+
+    Returns:
+        str -- Bookmark value
+    """
+    return row['yearperiod'].replace('/', '-')
+
+
+def _year_period_bookmark(row: dict) -> str:
+    """Build a YYYY-MM bookmark from separate year and period fields.
+
+    Arguments:
+        row {dict} -- Record
+
+    Returns:
+        str -- Bookmark value
+    """
+    # The format specs pad in C, without the str()/rjust intermediates
+    return f"{int(row['year']):04d}-{int(row['period']):02d}"
+
+
+# Bookmark strategy per stream, built once instead of re-creating the
+# membership sets on every record
+_BOOKMARK_STRATEGIES: MappingProxyType = MappingProxyType({
+    'bank_transactions': _yearperiod_bookmark,
+    'general_ledger_transactions': _yearperiod_bookmark,
+    'transactions_to_be_matched': _yearperiod_bookmark,
+    'general_ledger_details': _year_period_bookmark,
+    'annual_report': _year_period_bookmark,
+    'multicurrency': _year_period_bookmark,
+    'suppliers': _year_period_bookmark,
+})
+
+
 def clear_currently_syncing(state: dict) -> dict:
     """Clear the currently syncing from the state.
 
@@ -17,7 +56,8 @@ def clear_currently_syncing(state: dict) -> dict:
     Returns:
         dict -- New state file
     """
-    return state.pop('currently_syncing', None)
+    state.pop('currently_syncing', None)
+    return state
 
 
 def get_stream_state(state: dict, tap_stream_id: str) -> dict:
@@ -30,10 +70,12 @@ def get_stream_state(state: dict, tap_stream_id: str) -> dict:
     Returns:
         dict -- The state of the stream
     """
-    return state.get(
-        'bookmarks',
-        {},
-    ).get(tap_stream_id)
+    # A single lookup path: no throwaway dict on the miss side
+    bookmarks: Optional[dict] = state.get('bookmarks')
+
+    if bookmarks:
+        return bookmarks.get(tap_stream_id)
+    return None
 
 
 def get_bookmark_value(
@@ -49,25 +91,10 @@ def get_bookmark_value(
     Returns:
         str -- Bookmark value
     """
-    if stream_name in {
-        'bank_transactions',
-        'general_ledger_transactions',
-        'transactions_to_be_matched',
-    }:
-        # YYYY-MM
-        return row['yearperiod'].replace('/', '-')
-
-    elif stream_name in {
-        'general_ledger_details',
-        'annual_report',
-        'multicurrency',
-        'suppliers',
-    }:
-        # YYYY-MM
-
-        year: str = str(row['year'])
-        period: str = str(row['period']).rjust(2, '0')
-        return f'{year}-{period}'
+    strategy: Optional[Callable] = _BOOKMARK_STRATEGIES.get(stream_name)
+
+    if strategy:
+        return strategy(row)
     return None
 
 
@@ -89,7 +116,7 @@ def update_bookmark(
         singer.write_bookmark(
             state,
             stream.tap_stream_id,
-            STREAMS[stream.tap_stream_id]['bookmark'],
+            STREAMS[stream.tap_stream_id].bookmark,
             bookmark,
         )
 
@@ -3,25 +3,93 @@
 
 import logging
 import os
-from datetime import date, datetime
-from typing import Callable, Generator, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from types import MappingProxyType
+from typing import Callable, Generator
 
-import pandas as pd
 import singer
-from dateutil.rrule import MONTHLY, rrule
-from defusedxml import ElementTree
-from lxml import etree  # noqa: S410: lxml is only used for pretty printing
-from lxml.html import HtmlElement, fromstring  # noqa: S410
-from zeep import Client
+from lxml import etree  # noqa: S410: entity resolution is disabled
+from requests import Session
+from requests.adapters import HTTPAdapter
+from zeep import Client, Settings
+from zeep.cache import SqliteCache
+from zeep.transports import Transport
 
 from tap_twinfield.cleaners import CLEANERS
-from tap_twinfield.queries import QUERIES
+from tap_twinfield.queries import render
 
 # Disable warnings for sub packages
 logging.getLogger('zeep').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=None)
+def _months_till_now(start_date: str) -> tuple:
+    """Build YYYY/MM for every month from start_date until now.
+
+    Streams typically share one start_date; the memoized tuple is
+    built once per run instead of re-parsing the date and re-running
+    the recurrence per stream.
+
+    Arguments:
+        start_date {str} -- Start month e.g. 2020-01
+
+    Returns:
+        tuple -- Every month until now.
+    """
+    # Parse input date with a single split; int() tolerates the
+    # whitespace the old lstrip handled
+    year_part, month_part = start_date.split('-')[:2]
+    year: int = int(year_part)
+    month: int = int(month_part)
+
+    # Current month is the inclusive upper bound
+    now: datetime = datetime.utcnow()
+
+    # Walk the months with plain arithmetic; a recurrence rule is
+    # heavyweight machinery for a monthly counter
+    months: list = []
+    while (year, month) <= (now.year, now.month):
+        months.append(f'{year:04d}/{month:02d}')
+        month += 1
+
+        if month > 12:
+            year += 1
+            month = 1
+
+    return tuple(months)
+
+
+# Parser for the browse-fields responses: XML responses go through
+# the XML parser (the HTML parser is slower and can mangle them), and
+# stripping the blank text lets pretty_print re-indent cleanly
+_PRETTY_PARSER: etree.XMLParser = etree.XMLParser(
+    remove_blank_text=True,
+    resolve_entities=False,
+)
+
+# How many month extracts may be in flight at once. Matches the
+# connection pool width so every worker gets a kept-alive connection.
+_MAX_PARALLEL_MONTHS: int = 4
+
+# Browse code and log label per stream, consumed by _run_stream
+_STREAM_SPECS: MappingProxyType = MappingProxyType({
+    'annual_report_multicurrency': ('060', 'annual report multicurrency'),
+    'annual_report': ('040_1', 'annual report'),
+    'bank_transactions': ('410', 'bank transactions'),
+    'general_ledger_details': ('030_3', 'general ledger details'),
+    'general_ledger_transactions': ('000', 'general ledger transactions'),
+    'suppliers': ('230_2', 'suppliers'),
+    'transaction_list': ('020', 'transaction list'),
+    'transaction_summary': ('670', 'transaction summary'),
+    'transactions_to_be_matched': ('010', 'transactions to be matched'),
+})
+
+
 API_SCHEME: str = 'https://'
 API_BASE_URL: str = 'login.twinfield.com'
 API_BASE_PATH: str = '/webservices'
@@ -52,14 +120,35 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         self.organisation: str = organisation
         self.office: str = office
         self._auth_header: dict = {}
+        self._soap_headers: dict = {}
         self.cluser: str
         self._logged_in: bool = False
 
         # Setup logger
         self.logger: logging.RootLogger = singer.get_logger()
 
+        # One pooled HTTP session shared by every SOAP client, so
+        # requests reuse the TCP/TLS connection instead of paying a
+        # fresh handshake per call
+        http_session: Session = Session()
+        http_session.mount(API_SCHEME, HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+        ))
+        # The XML responses compress extremely well; make sure every
+        # request on the shared session negotiates compression
+        http_session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+        # The WSDL cache persists the schema documents across client
+        # constructions and tap invocations, skipping the download and
+        # re-parse on every start
+        self._transport: Transport = Transport(
+            session=http_session,
+            cache=SqliteCache(),
+        )
+
         self._login()
         self.session: Client = self._create_session()
+        self._process: Client = self._create_process_client()
 
     def select_company(self, company: str) -> None:
         """Select a different company.
@@ -78,14 +167,31 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         # Query API
         self.session.service.SelectCompany(
             company,
-            _soapheaders={'Header': self._auth_header},
+            _soapheaders=self._soap_headers,
         )
 
         self.logger.info(f'Switched to company: {company}')
 
-    def export_data(self, query: str) -> List[dict]:  # noqa: WPS210
+    def export_data(self, query: str) -> Generator[dict, None, None]:
         """Export data from Twinfield.
 
+        Rows are parsed and yielded one at a time, so peak memory stays
+        at one row instead of a whole monthly extract.
+
+        Arguments:
+            query {str} -- Browse query
+
+        Raises:
+            RuntimeError: When not logged in
+
+        Yields:
+            Generator[dict, None, None] -- Query output
+        """
+        yield from self._parse_rows(self._process_xml(query))
+
+    def _process_xml(self, query: str) -> str:
+        """Run a query through the ProcessXML service.
+
         Arguments:
             query {str} -- Browse query
 
@@ -93,7 +199,7 @@ class Twinfield(object):  # noqa: WPS214, WPS230
             RuntimeError: When not logged in
 
         Returns:
-            List[dict] -- Query output
+            str -- Raw response
         """
         if not self._logged_in:
             raise RuntimeError('Must login before data can be exported')
@@ -101,36 +207,54 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         self.logger.debug('Export query')
 
         # Query API
-        proces: Client = Client(
-            f'{self.cluster}{API_BASE_PATH}{API_PATH_PROCESS_XML}',
-        )
-        response: str = proces.service.ProcessXmlString(
+        return self._process.service.ProcessXmlString(
             query,
-            _soapheaders={'Header': self._auth_header},
+            _soapheaders=self._soap_headers,
         )
 
-        # Get Twinfield data
-        root: ElementTree.Element = ElementTree.fromstring(response)
-
-        # Get columns
-        columns: list = [element.attrib['label'] for element in root[0]]
-        columns.append('?')
+    def _parse_rows(self, response: str) -> Generator[dict, None, None]:
+        """Parse the rows of an export response.
 
-        # Get data
-        twin_data: list = [[field.text for field in row] for row in root[1::]]
+        Arguments:
+            response {str} -- ProcessXmlString response
 
-        # Convert to DataFrame
-        df: pd.DataFrame = pd.DataFrame(twin_data, columns=columns)
+        Yields:
+            Generator[dict, None, None] -- Parsed rows
+        """
+        source: BytesIO = BytesIO(response.encode('utf-8'))
+        columns: list = []
+
+        # iterparse yields each element as it completes, so the full
+        # tree is never materialized. Entity resolution stays off for
+        # the XXE safety defusedxml used to give, huge_tree lifts the
+        # size limits for large months.
+        rows: etree.iterparse = etree.iterparse(
+            source,
+            events=('end',),
+            tag=('th', 'tr'),
+            resolve_entities=False,
+            huge_tree=True,
+        )
 
-        # Remove unknown columns
-        df.drop('?', axis=1, inplace=True)
+        for _, element in rows:
+            if element.tag == 'th':
+                # The header row carries the column labels. zip stops
+                # at the shortest input, so the unlabeled trailing cell
+                # of each row drops out without a sentinel column.
+                columns = [cell.attrib['label'] for cell in element]
+            else:
+                yield dict(zip(columns, (cell.text for cell in element)))
 
-        # Return rows
-        return df.to_dict(orient='records')
+            # Free the consumed element
+            element.clear()
 
-    def get_all_browse_fields(self) -> str:
+    def get_all_browse_fields(self, pretty: bool = True) -> str:
         """Retrieve all possible browse fields.
 
+        Keyword Arguments:
+            pretty {bool} -- Whether to prettify the output
+                (default: {True})
+
         Returns:
             str -- All possible browse fields
         """
@@ -142,22 +266,27 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         self.logger.info('Retrieve all possible browse fields')
 
         # Query API
-        proces: Client = Client(
-            f'{self.cluster}{API_BASE_PATH}{API_PATH_PROCESS_XML}',
-        )
-        response: str = proces.service.ProcessXmlString(
+        response: str = self._process.service.ProcessXmlString(
             query,
-            _soapheaders={'Header': self._auth_header},
+            _soapheaders=self._soap_headers,
         )
 
+        # Programmatic consumers can skip the reformatting pass
+        if not pretty:
+            return response
+
         # Prettify output
-        root: HtmlElement = fromstring(response)
+        root: etree._Element = etree.fromstring(  # noqa: WPS437
+            response.encode('utf-8'),
+            _PRETTY_PARSER,
+        )
         return etree.tostring(root, encoding='unicode', pretty_print=True)
 
     def get_browse_fields(  # noqa: WPS210
         self,
         code: str,
         to_file: bool = False,
+        pretty: bool = True,
     ) -> str:
         """Retrieve all possible browse fields for a code.
 
@@ -166,6 +295,8 @@ class Twinfield(object):  # noqa: WPS214, WPS230
 
         Keyword Arguments:
             to_file {bool} -- Whether to save output to file (default: {False})
+            pretty {bool} -- Whether to prettify the output
+                (default: {True})
 
         Returns:
             str -- Browse fields for the browse code
@@ -179,29 +310,37 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         self.logger.info(f'Retrieving browse fields for browse code: {code}')
 
         # Query API
-        proces: Client = Client(
-            f'{self.cluster}{API_BASE_PATH}{API_PATH_PROCESS_XML}',
-        )
-        response: str = proces.service.ProcessXmlString(
+        response: str = self._process.service.ProcessXmlString(
             query,
-            _soapheaders={'Header': self._auth_header},
+            _soapheaders=self._soap_headers,
         )
 
-        # Prettify output
-        root: HtmlElement = fromstring(response)
-        out: str = etree.tostring(root, encoding='unicode', pretty_print=True)
+        if pretty:
+            # Prettify output
+            root: etree._Element = etree.fromstring(  # noqa: WPS437
+                response.encode('utf-8'),
+                _PRETTY_PARSER,
+            )
+            out: str = etree.tostring(
+                root,
+                encoding='unicode',
+                pretty_print=True,
+            )
+        else:
+            # Programmatic consumers can skip the reformatting pass
+            out = response
 
         # Save output to a file
         if to_file:
-            if not os.path.isdir('fields'):
-                os.mkdir('fields')
+            # One call, no stat-then-create race
+            os.makedirs('fields', exist_ok=True)
 
             with open(f'fields/{code}.txt', 'w') as output_file:
                 output_file.write(out)
 
         return out
 
-    def annual_report_multicurrency(  # noqa: WPS210
+    def annual_report_multicurrency(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -213,39 +352,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Annual Report (Multicurrency)
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('annual_report_multicurrency', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['060']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting annual report multicurrency (060) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received annual report multicurrency (060) for month '
-                f'{date_month}: {record_count} records',
-            )
-
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
+        return self._run_stream('annual_report_multicurrency', start_date)
 
-    def annual_report(  # noqa: WPS210
+    def annual_report(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -257,39 +366,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Annual Report
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('annual_report', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['040_1']
+        return self._run_stream('annual_report', start_date)
 
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting annual report (040_1) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received annual report (040_1) for month '
-                f'{date_month}: {record_count} records',
-            )
-
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def bank_transactions(  # noqa: WPS210
+    def bank_transactions(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -301,39 +380,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Bank transactions
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('bank_transactions', {})
+        return self._run_stream('bank_transactions', start_date)
 
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['410']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting bank transactions (410) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received bank transactions (410) for month '
-                f'{date_month}: {record_count} records',
-            )
-
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def general_ledger_details(  # noqa: WPS210
+    def general_ledger_details(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -345,39 +394,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- General Ledger Details (v3)
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('general_ledger_details', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['030_3']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
+        return self._run_stream('general_ledger_details', start_date)
 
-            # Perform query
-            self.logger.info(
-                'Extracting general ledger details (030_3) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received general ledger details (030_3) for month '
-                f'{date_month}: {record_count} records',
-            )
-
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def general_ledger_transactions(  # noqa: WPS210
+    def general_ledger_transactions(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -389,39 +408,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- General Ledger Transactions
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('general_ledger_transactions', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
+        return self._run_stream('general_ledger_transactions', start_date)
 
-            # Retrieve query
-            query: str = QUERIES['000']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting general ledger transactions (000) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received general ledger transactions (000) for month '
-                f'{date_month}: {record_count} records',
-            )
-
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def suppliers(  # noqa: WPS210
+    def suppliers(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -433,39 +422,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Supplier Invoices
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('suppliers', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['230_2']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting suppliers (230_2) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received suppliers (230_2) for month '
-                f'{date_month}: {record_count} records',
-            )
+        return self._run_stream('suppliers', start_date)
 
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def transaction_list(  # noqa: WPS210
+    def transaction_list(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -477,39 +436,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Transaction list
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('transaction_list', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['020']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting transaction list (020) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
-
-            record_count: int = len(export)
-            self.logger.info(
-                'Received transaction list (020) for month '
-                f'{date_month}: {record_count} records',
-            )
+        return self._run_stream('transaction_list', start_date)
 
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def transaction_summary(  # noqa: WPS210
+    def transaction_summary(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -521,39 +450,9 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Transaction Summary
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('transaction_summary', {})
-
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
-
-            # Retrieve query
-            query: str = QUERIES['670']
-
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
-
-            # Perform query
-            self.logger.info(
-                'Extracting transaction summary (670) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
+        return self._run_stream('transaction_summary', start_date)
 
-            record_count: int = len(export)
-            self.logger.info(
-                'Received transaction summary (670) for month '
-                f'{date_month}: {record_count} records',
-            )
-
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
-
-    def transactions_to_be_matched(  # noqa: WPS210
+    def transactions_to_be_matched(
         self,
         start_date: str,
     ) -> Generator[dict, None, None]:
@@ -565,63 +464,79 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         Returns:
             Generator[dict, None, None] -- Transactions still to be matched
         """
-        # Retrieve cleaner
-        cleaner: Callable = CLEANERS.get('transactions_to_be_matched', {})
+        return self._run_stream('transactions_to_be_matched', start_date)
 
-        # For every month from start_date until now
-        for date_month in self._start_month_till_now(start_date):
+    def _run_stream(  # noqa: WPS210
+        self,
+        stream_id: str,
+        start_date: str,
+    ) -> Generator[dict, None, None]:
+        """Extract and clean a stream month by month.
 
-            # Retrieve query
-            query: str = QUERIES['010']
+        The cleaner and browse code are bound once per stream, outside
+        the per-month and per-record loops. The SOAP round-trips are
+        latency-bound, so a few months are fetched ahead on a thread
+        pool over the shared session while the current month is parsed
+        and emitted; rows are yielded strictly in month order.
 
-            # Replace dates in placeholders
-            query = query.replace(':period_lower:', date_month)
-            query = query.replace(':period_upper:', date_month)
+        Arguments:
+            stream_id {str} -- Stream name
+            start_date {str} -- Start date e.g. 2021-01
 
-            # Perform query
-            self.logger.info(
-                'Extracting transactions to be matched (010) for month '
-                f'{date_month}',
-            )
-            export: List[dict] = self.export_data(query)
+        Yields:
+            Generator[dict, None, None] -- Cleaned rows
+        """
+        code, log_name = _STREAM_SPECS[stream_id]
+
+        # Retrieve cleaner. Direct indexing: a missing cleaner should
+        # raise here, not surface later as a non-callable default.
+        cleaner: Callable = CLEANERS[stream_id]
+
+        def emit(date_month: str, future: Future) -> Generator:
+            record_count: int = 0
+
+            # Yield data after cleaning, counting as it streams past
+            # so the month is never materialized for the log line
+            for number, row in enumerate(self._parse_rows(future.result())):
+                yield cleaner(row, number)
+                record_count = number + 1
 
-            record_count: int = len(export)
             self.logger.info(
-                'Received transactions to be matched (010) for month '
+                f'Received {log_name} ({code}) for month '
                 f'{date_month}: {record_count} records',
             )
 
-            # Yield data after cleaning
-            yield from (
-                cleaner(row, number)
-                for number, row in enumerate(export)
-            )
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_MONTHS) as pool:
+            pending: deque = deque()
+
+            # For every month from start_date until now
+            for date_month in self._start_month_till_now(start_date):
+                self.logger.info(
+                    f'Extracting {log_name} ({code}) for month {date_month}',
+                )
+                pending.append((date_month, pool.submit(
+                    self._process_xml,
+                    render(code, date_month),
+                )))
+
+                # Keep at most the pool width in flight, so responses
+                # do not pile up faster than they are consumed
+                if len(pending) == _MAX_PARALLEL_MONTHS:
+                    yield from emit(*pending.popleft())
 
-    def _start_month_till_now(self, start_date: str) -> Generator:
-        """Yield YYYY/MM for every month until now.
+            while pending:
+                yield from emit(*pending.popleft())
+
+    def _start_month_till_now(self, start_date: str) -> tuple:
+        """Return YYYY/MM for every month until now.
 
         Arguments:
             start_date {str} -- Start month e.g. 2020-01
 
-        Yields:
-            Generator -- Every month until now.
+        Returns:
+            tuple -- Every month until now.
         """
-        # Parse input date
-        year: int = int(start_date.split('-')[0])
-        month: int = int(start_date.split('-')[1].lstrip())
-
-        # Setup start period
-        period: date = date(year, month, 1)
-
-        # Setup itterator
-        dates: rrule = rrule(
-            freq=MONTHLY,
-            dtstart=period,
-            until=datetime.utcnow(),
-        )
-
-        # Yield dates in YYYY/MM format
-        yield from (date_month.strftime('%Y/%m') for date_month in dates)
+        return _months_till_now(start_date)
 
     def _login(self) -> None:
         """Authenticate with the API."""
@@ -630,7 +545,7 @@ class Twinfield(object):  # noqa: WPS214, WPS230
         )
 
         # Setup client
-        client: Client = Client(url)
+        client: Client = Client(url, transport=self._transport)
 
         # Login
         auth: dict = client.service.Logon(
@@ -639,8 +554,10 @@ class Twinfield(object):  # noqa: WPS214, WPS230
             self.organisation,
         )
 
-        # Save headers
+        # Save headers. The wrapper dict every SOAP call passes as
+        # _soapheaders is built once here instead of per request.
         self._auth_header = auth['header']['Header']
+        self._soap_headers = {'Header': self._auth_header}
         self.cluster: str = auth['body']['cluster']
         self._logged_in = True
 
@@ -664,4 +581,34 @@ class Twinfield(object):  # noqa: WPS214, WPS230
             )
 
         self.logger.debug('Creating a session')
-        return Client(f'{self.cluster}{API_BASE_PATH}{API_PATH_SESSION}')
+        return Client(
+            f'{self.cluster}{API_BASE_PATH}{API_PATH_SESSION}',
+            transport=self._transport,
+        )
+
+    def _create_process_client(self) -> Client:
+        """Create the ProcessXML client.
+
+        The client is built once and reused for every query: parsing
+        the WSDL costs a network round-trip plus an XML schema build,
+        which the per-call construction used to repeat per export.
+
+        Raises:
+            RuntimeError: When not logged in
+
+        Returns:
+            Client -- ProcessXML client
+        """
+        if not self._logged_in:
+            raise RuntimeError(
+                'Must be logged in before a client can be created',
+            )
+
+        # Strict schema validation burns CPU on every call for
+        # responses that our own parser consumes anyway; xml_huge_tree
+        # lifts lxml's size limits for large browse responses
+        return Client(
+            f'{self.cluster}{API_BASE_PATH}{API_PATH_PROCESS_XML}',
+            transport=self._transport,
+            settings=Settings(strict=False, xml_huge_tree=True),
+        )